@@ -1,15 +1,90 @@
 """
 Example script showing how to use the MCP server with an MCP client.
 
-This demonstrates connecting to the SSE server and calling tools.
+This demonstrates connecting to the SSE server and calling tools. A single
+session is opened and reused for every call, so the SSE connection and the
+MCP handshake are paid for only once.
 """
 
 import asyncio
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
-from mcp import types
 from mcp.client.session import ClientSession
 from mcp.client.sse import sse_client
+from pydantic import AnyUrl
+
+
+@asynccontextmanager
+async def get_session(server_url: str) -> AsyncIterator[ClientSession]:
+    """Open an SSE connection and yield an initialized MCP session.
+
+    Keep the session open for as long as calls are needed and share it
+    between them instead of reconnecting per call.
+    """
+    async with sse_client(server_url) as (read_stream, write_stream):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            yield session
+
+
+async def run_demo(session: ClientSession) -> None:
+    """Exercise tools, resources and prompts over an existing session."""
+    # List available tools
+    tools_result = await session.list_tools()
+    print(f"\nAvailable tools: {len(tools_result.tools)}")
+    for tool in tools_result.tools:
+        print(f"  - {tool.name}: {tool.description}")
+
+    # List available resources
+    resources_result = await session.list_resources()
+    print(f"\nAvailable resources: {len(resources_result.resources)}")
+    for resource in resources_result.resources:
+        print(f"  - {resource.name} ({resource.uri})")
+
+    # List available prompts
+    prompts_result = await session.list_prompts()
+    print(f"\nAvailable prompts: {len(prompts_result.prompts)}")
+    for prompt in prompts_result.prompts:
+        print(f"  - {prompt.name}: {prompt.description}")
+
+    # Call a tool
+    print("\n--- Calling calculate_sum tool ---")
+    tool_result = await session.call_tool("calculate_sum", arguments={"a": 5, "b": 3})
+    for content in tool_result.content:
+        text = getattr(content, "text", None)
+        if text is not None:
+            print(f"Result: {text}")
+
+    # Call several tools concurrently over the same session
+    print("\n--- Calling tools concurrently ---")
+    results = await asyncio.gather(
+        session.call_tool("calculate_multiply", arguments={"a": 4, "b": 5}),
+        session.call_tool("calculate_divide", arguments={"a": 10, "b": 4}),
+    )
+    for result in results:
+        for content in result.content:
+            text = getattr(content, "text", None)
+            if text is not None:
+                print(f"Result: {text}")
+
+    # Read a resource
+    print("\n--- Reading resource ---")
+    resource_contents = await session.read_resource(AnyUrl("config://app"))
+    for content in resource_contents.contents:
+        text = getattr(content, "text", None)
+        if text is not None:
+            print(f"Resource content: {text}")
+
+    # Get a prompt
+    print("\n--- Getting prompt ---")
+    prompt_result = await session.get_prompt("greeting", arguments={"name": "World"})
+    print(f"Prompt description: {prompt_result.description}")
+    for message in prompt_result.messages:
+        text = getattr(message.content, "text", None)
+        if text is not None:
+            print(f"Message: {text}")
 
 
 async def main() -> None:
@@ -18,58 +93,9 @@ async def main() -> None:
 
     print(f"Connecting to MCP server at {server_url}...")
 
-    async with sse_client(server_url) as (read_stream, write_stream):
-        async with ClientSession(read_stream, write_stream) as session:
-            # Initialize the connection
-            await session.initialize()
-            print("✓ Connected and initialized")
-
-            # List available tools
-            tools_result = await session.list_tools()
-            print(f"\nAvailable tools: {len(tools_result.tools)}")
-            for tool in tools_result.tools:
-                print(f"  - {tool.name}: {tool.description}")
-
-            # List available resources
-            resources_result = await session.list_resources()
-            print(f"\nAvailable resources: {len(resources_result.resources)}")
-            for resource in resources_result.resources:
-                print(f"  - {resource.name} ({resource.uri})")
-
-            # List available prompts
-            prompts_result = await session.list_prompts()
-            print(f"\nAvailable prompts: {len(prompts_result.prompts)}")
-            for prompt in prompts_result.prompts:
-                print(f"  - {prompt.name}: {prompt.description}")
-
-            # Call a tool
-            print("\n--- Calling calculate_sum tool ---")
-            tool_result = await session.call_tool(
-                "calculate_sum", arguments={"a": 5, "b": 3}
-            )
-            for content in tool_result.content:
-                if isinstance(content, types.TextContent):
-                    print(f"Result: {content.text}")
-
-            # Read a resource
-            print("\n--- Reading resource ---")
-            from pydantic import AnyUrl
-
-            resource_uri = AnyUrl("config://app")
-            resource_contents = await session.read_resource(resource_uri)
-            for content in resource_contents.contents:
-                if isinstance(content, types.TextResourceContents):
-                    print(f"Resource content: {content.text}")
-
-            # Get a prompt
-            print("\n--- Getting prompt ---")
-            prompt_result = await session.get_prompt(
-                "greeting", arguments={"name": "World"}
-            )
-            print(f"Prompt description: {prompt_result.description}")
-            for message in prompt_result.messages:
-                if isinstance(message.content, types.TextContent):
-                    print(f"Message: {message.content.text}")
+    async with get_session(server_url) as session:
+        print("✓ Connected and initialized")
+        await run_demo(session)
 
 
 if __name__ == "__main__":
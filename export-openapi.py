@@ -1,11 +1,16 @@
 import argparse
-import json
 import os
 import sys
 
+import orjson
 import yaml
 from uvicorn.importer import import_from_string
 
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper
+
 parser = argparse.ArgumentParser(prog="extract-openapi.py")
 parser.add_argument("src", help='App import string. Eg. "main:app"', default="main:app")
 parser.add_argument("--app-dir", help="Directory containing the app", default=None)
@@ -33,10 +38,10 @@ if __name__ == "__main__":
     os.makedirs("docs", exist_ok=True)
     print(f"writing openapi spec v{version}")
 
-    with open("docs/openapi.json", "w", encoding="utf-8") as f:
-        json.dump(openapi, f, indent=2)
+    with open("docs/openapi.json", "wb") as f:
+        f.write(orjson.dumps(openapi, option=orjson.OPT_INDENT_2))
 
     with open("docs/openapi.yaml", "w", encoding="utf-8") as f:
-        yaml.dump(openapi, f, sort_keys=False)
+        yaml.dump(openapi, f, Dumper=YamlDumper, sort_keys=False)
 
     print("spec written to docs folder")
@@ -10,15 +10,18 @@ from sse_mcp_server.domain.protocols import HealthService
 class SystemHealthService(HealthService):
     """Implementation of HealthService for system status."""
 
+    def __init__(self) -> None:
+        """Initialize the health service with the fields fixed at startup."""
+        self._template: dict[str, Any] = {
+            "status": "online",
+            "version": settings.version,
+            "environment": settings.environment.value,
+        }
+
     async def check_health(self) -> dict[str, Any]:
         """Check system health status.
 
         Returns:
             Dictionary with status, version, and timestamp
         """
-        return {
-            "status": "online",
-            "version": settings.version,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "environment": settings.environment.value,
-        }
+        return {**self._template, "timestamp": datetime.now(timezone.utc).isoformat()}
@@ -20,21 +20,25 @@ class Environment(str, Enum):
     TEST = "test"
 
 
+# Accepted APP_ENV values; anything else falls back to development
+_ENVIRONMENTS: dict[str, Environment] = {
+    "production": Environment.PRODUCTION,
+    "prod": Environment.PRODUCTION,
+    "staging": Environment.STAGING,
+    "stage": Environment.STAGING,
+    "test": Environment.TEST,
+}
+
+
 def get_environment() -> Environment:
     """Get the current environment.
 
     Returns:
         Environment: The current environment
     """
-    match os.getenv("APP_ENV", "development").lower():
-        case "production" | "prod":
-            return Environment.PRODUCTION
-        case "staging" | "stage":
-            return Environment.STAGING
-        case "test":
-            return Environment.TEST
-        case _:
-            return Environment.DEVELOPMENT
+    return _ENVIRONMENTS.get(
+        os.getenv("APP_ENV", "development").lower(), Environment.DEVELOPMENT
+    )
 
 
 def load_env_file() -> str | None:
@@ -43,14 +47,23 @@ def load_env_file() -> str | None:
     base_dir = Path(__file__).parent.parent.parent.parent
 
     env_files = [
-        base_dir / f".env.{env.value}.local",
-        base_dir / f".env.{env.value}",
-        base_dir / ".env.local",
-        base_dir / ".env",
+        f".env.{env.value}.local",
+        f".env.{env.value}",
+        ".env.local",
+        ".env",
     ]
 
-    for env_file in env_files:
-        if env_file.is_file():
+    # List the directory once instead of probing each candidate path
+    try:
+        with os.scandir(base_dir) as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        # Unreadable or missing project root: run without a .env file
+        return None
+
+    for name in env_files:
+        if name in present:
+            env_file = base_dir / name
             load_dotenv(dotenv_path=env_file)
             return str(env_file)
 
@@ -63,10 +76,7 @@ def parse_list_from_env(env_key: str, default: list | None = None) -> list:
     if not value:
         return default or []
 
-    value = value.strip("\"'")
-    if "," not in value:
-        return [value]
-    return [item.strip() for item in value.split(",") if item.strip()]
+    return list(filter(None, map(str.strip, value.strip("\"'").split(","))))
 
 
 # Load env file on module import
@@ -125,6 +135,29 @@ class Settings:
     access to application settings with proper naming conventions.
     """
 
+    __slots__ = (
+        "environment",
+        "database_path",
+        "app_name",
+        "version",
+        "description",
+        "api_v1_str",
+        "host",
+        "port",
+        "debug",
+        "sse_ping_interval",
+        "cors",
+        "logging",
+        "rate_limit",
+        "redis",
+        "allowed_origins",
+        "log_dir",
+        "log_level",
+        "log_format",
+        "rate_limit_default",
+        "rate_limit_endpoints",
+    )
+
     def __init__(self):
         """Initialize application settings from environment variables."""
         # Environment
@@ -144,6 +177,7 @@ class Settings:
         self.host = os.getenv("APP_HOST", "0.0.0.0")
         self.port = int(os.getenv("APP_PORT", "5001"))
         self.debug = os.getenv("DEBUG", "false").lower() in ("true", "1", "yes")
+        self.sse_ping_interval = float(os.getenv("SSE_PING_INTERVAL", "15"))
 
         # Configuration objects
         self.cors = CorsConfig()
@@ -154,36 +188,13 @@ class Settings:
         # Apply environment-specific settings
         self._apply_environment_settings()
 
-    # Compatibility properties for direct access
-    @property
-    def allowed_origins(self) -> list:
-        """Get allowed origins for CORS."""
-        return self.cors.allowed_origins
-
-    @property
-    def log_dir(self) -> Path:
-        """Get log directory."""
-        return self.logging.log_dir
-
-    @property
-    def log_level(self) -> str:
-        """Get log level."""
-        return self.logging.log_level
-
-    @property
-    def log_format(self) -> str:
-        """Get log format."""
-        return self.logging.log_format
-
-    @property
-    def rate_limit_default(self) -> list:
-        """Get default rate limit."""
-        return self.rate_limit.default
-
-    @property
-    def rate_limit_endpoints(self) -> dict:
-        """Get rate limit endpoints."""
-        return self.rate_limit.endpoints
+        # Flattened values for direct access, read after environment overrides
+        self.allowed_origins: list = self.cors.allowed_origins
+        self.log_dir: Path = self.logging.log_dir
+        self.log_level: str = self.logging.log_level
+        self.log_format: str = self.logging.log_format
+        self.rate_limit_default: list = self.rate_limit.default
+        self.rate_limit_endpoints: dict = self.rate_limit.endpoints
 
     def _apply_environment_settings(self):
         """Apply environment-specific settings."""
@@ -2,6 +2,10 @@
 
 This module sets up the MCP server instance and registers all available
 tools, resources, and prompts using the tool factory pattern.
+
+Handlers run for every MCP request, so log with lazy ``%s`` arguments and wrap
+debug calls in ``logger.isEnabledFor(logging.DEBUG)`` so nothing is formatted
+when debug logging is off.
 """
 
 import logging
@@ -13,7 +17,7 @@ from pydantic import AnyUrl
 
 from sse_mcp_server.config.settings import settings
 from sse_mcp_server.infrastructure.tool_factory import (
-    CalculatorTool,
+    create_calculator_tool,
     create_simple_tool,
     tool_registry,
 )
@@ -29,7 +33,7 @@ def register_tools() -> None:
     """Register all MCP tools."""
     # Register calculator tools using factory
     for operation in ["sum", "subtract", "multiply", "divide"]:
-        tool_registry.register(CalculatorTool(operation))
+        tool_registry.register(create_calculator_tool(operation))
 
     # Register custom simple tool example
     def get_server_info(_args: dict[str, Any]) -> dict[str, str]:
@@ -53,24 +57,18 @@ def register_tools() -> None:
 # Register tools on module import
 register_tools()
 
+# Resources and prompts are static, so they are built once at import time
+_APP_CONFIG_URI = "config://app"
 
-@mcp_server.list_resources()
-async def handle_list_resources() -> list[types.Resource]:
-    """List available resources."""
-    return [
-        types.Resource(
-            uri=AnyUrl("config://app"),
-            name="App Config",
-            mimeType="text/plain",
-        )
-    ]
-
+_RESOURCES = [
+    types.Resource(
+        uri=AnyUrl(_APP_CONFIG_URI),
+        name="App Config",
+        mimeType="text/plain",
+    )
+]
 
-@mcp_server.read_resource()
-async def handle_read_resource(uri: AnyUrl) -> str:
-    """Read a specific resource."""
-    if str(uri) == "config://app":
-        return f"""Application Configuration:
+_APP_CONFIG_TEXT = f"""Application Configuration:
         - Name: {settings.app_name}
         - Version: {settings.version}
         - Environment: {settings.environment.value}
@@ -78,6 +76,33 @@ async def handle_read_resource(uri: AnyUrl) -> str:
         - Host: {settings.host}
         - Port: {settings.port}
         """
+
+_PROMPTS = [
+    types.Prompt(
+        name="greeting",
+        description="Generate a greeting",
+        arguments=[
+            types.PromptArgument(
+                name="name",
+                description="Name of the person to greet",
+                required=True,
+            )
+        ],
+    )
+]
+
+
+@mcp_server.list_resources()
+async def handle_list_resources() -> list[types.Resource]:
+    """List available resources."""
+    return _RESOURCES
+
+
+@mcp_server.read_resource()
+async def handle_read_resource(uri: AnyUrl) -> str:
+    """Read a specific resource."""
+    if str(uri) == _APP_CONFIG_URI:
+        return _APP_CONFIG_TEXT
     raise ValueError(f"Resource not found: {uri}")
 
 
@@ -92,6 +117,8 @@ async def handle_call_tool(
     name: str, arguments: dict[str, Any] | None
 ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
     """Handle tool execution using the tool registry."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Calling tool %s with arguments %s", name, arguments)
     try:
         return await tool_registry.execute_tool(name, arguments)
     except (ValueError, KeyError, RuntimeError) as e:
@@ -102,19 +129,7 @@ async def handle_call_tool(
 @mcp_server.list_prompts()
 async def handle_list_prompts() -> list[types.Prompt]:
     """List available prompts."""
-    return [
-        types.Prompt(
-            name="greeting",
-            description="Generate a greeting",
-            arguments=[
-                types.PromptArgument(
-                    name="name",
-                    description="Name of the person to greet",
-                    required=True,
-                )
-            ],
-        )
-    ]
+    return _PROMPTS
 
 
 @mcp_server.get_prompt()
@@ -122,6 +137,8 @@ async def handle_get_prompt(
     name: str, arguments: dict[str, str] | None
 ) -> types.GetPromptResult:
     """Generate a prompt."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Getting prompt %s with arguments %s", name, arguments)
     if name == "greeting":
         user_name = (arguments or {}).get("name", "User")
         return types.GetPromptResult(
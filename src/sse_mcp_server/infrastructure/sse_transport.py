@@ -0,0 +1,236 @@
+"""SSE transport for the MCP server.
+
+This module extends the MCP SDK ``SseServerTransport`` so that the event stream
+sent to clients is produced by our own generator. Keepalive pings are emitted
+from the same loop that forwards MCP messages instead of a separate timer task,
+and every event is framed as bytes once, before it is queued. Frames that are
+already queued when the stream writes are coalesced into a single body chunk,
+after yielding once to the event loop so frames produced in the same tick can
+join the batch. The stream ends once the server closes the session.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import Any
+from urllib.parse import quote
+from uuid import uuid4
+
+import anyio
+import pydantic_core
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+from mcp.server.auth.middleware.bearer_auth import (
+    AuthenticatedUser,
+    authorization_context,
+)
+from mcp.server.sse import SseServerTransport
+from mcp.shared.message import SessionMessage
+from sse_starlette import EventSourceResponse
+from starlette.requests import Request
+from starlette.types import Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Returned by _get_message_with_timeout when no message arrived in time
+_KEEPALIVE = object()
+
+# Queued by the writer once the server closes the session; ends the stream
+_END_OF_STREAM = object()
+
+# SSE comment frame sent to keep idle connections open through proxies
+_KEEPALIVE_FRAME = b": ping\n\n"
+
+# Outgoing frames buffered per connection before the writer blocks
+_QUEUE_SIZE = 32
+
+# Upper bound for a coalesced body chunk
+_MAX_BATCH_BYTES = 16 * 1024
+
+
+def _build_sse_frame(event: bytes, data: bytes) -> bytes:
+    """Build a complete SSE frame.
+
+    Args:
+        event: Event name
+        data: Event payload, which must not contain newlines
+
+    Returns:
+        Encoded frame ready to be written to the response body
+    """
+    return b"event: " + event + b"\ndata: " + data + b"\n\n"
+
+
+async def _get_message_with_timeout(queue: asyncio.Queue, timeout: float) -> Any:
+    """Wait for the next queued message, giving up after ``timeout`` seconds.
+
+    A message that is already queued is returned without waiting. Otherwise,
+    unlike ``asyncio.wait_for``, this never raises ``TimeoutError`` when the
+    connection is idle, so keepalives do not go through exception handling.
+    A ``timeout`` of zero or less disables keepalives and waits for a message.
+
+    Args:
+        queue: Queue holding outgoing SSE events
+        timeout: Seconds to wait before a keepalive is due, or <= 0 for never
+
+    Returns:
+        The next message, or ``_KEEPALIVE`` if the timeout elapsed first
+    """
+    # Busy connections never need the timer, so skip creating the tasks
+    if not queue.empty():
+        return queue.get_nowait()
+    if timeout <= 0:
+        return await queue.get()
+
+    get_task = asyncio.ensure_future(queue.get())
+    keepalive = asyncio.ensure_future(asyncio.sleep(timeout))
+    try:
+        await asyncio.wait({get_task, keepalive}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        keepalive.cancel()
+        get_task.cancel()
+
+    if get_task.done() and not get_task.cancelled():
+        return get_task.result()
+    return _KEEPALIVE
+
+
+def _drain_frames(first: bytes, queue: asyncio.Queue) -> bytes:
+    """Append frames already waiting in the queue to ``first``.
+
+    Frames are kept intact, so the client still receives one SSE event per
+    MCP message; they just share one write.
+
+    Args:
+        first: Frame that was just taken from the queue
+        queue: Queue holding outgoing SSE frames
+
+    Returns:
+        The concatenated frames, at most about ``_MAX_BATCH_BYTES`` long
+    """
+    if queue.empty():
+        return first
+
+    frames = [first]
+    size = len(first)
+    while size < _MAX_BATCH_BYTES and not queue.empty():
+        frame = queue.get_nowait()
+        if frame is _END_OF_STREAM:
+            # Nothing is queued after the end marker, so it can go back
+            queue.put_nowait(frame)
+            break
+        frames.append(frame)
+        size += len(frame)
+    return b"".join(frames)
+
+
+class SseTransport(SseServerTransport):
+    """SSE server transport with in-loop keepalive pings."""
+
+    def __init__(self, endpoint: str, ping_interval: float = 15.0, **kwargs: Any):
+        """Initialize SSE transport.
+
+        Args:
+            endpoint: Relative path where clients POST their messages
+            ping_interval: Seconds of inactivity before a keepalive is sent;
+                zero or less disables keepalives
+            **kwargs: Extra arguments forwarded to ``SseServerTransport``
+        """
+        super().__init__(endpoint, **kwargs)
+        self._ping_interval = ping_interval
+
+    # Mirrors SseServerTransport.connect_sse from mcp 1.30.0 (pinned in
+    # requirements.txt), including its private attributes and request
+    # validation. Diff upstream changes, security fixes in particular, into
+    # this method before bumping the SDK. ping=0 needs sse-starlette >= 3.4.9,
+    # where it disables the built-in ping task instead of busy-looping.
+    @asynccontextmanager
+    async def connect_sse(self, scope: Scope, receive: Receive, send: Send):
+        """Set up an SSE stream and yield the MCP read/write streams.
+
+        Args:
+            scope: ASGI scope of the GET request
+            receive: ASGI receive callable
+            send: ASGI send callable
+
+        Raises:
+            ValueError: If the request is not HTTP or fails security validation
+        """
+        if scope["type"] != "http":
+            raise ValueError("connect_sse can only handle HTTP requests")
+
+        # Validate request headers for DNS rebinding protection
+        request = Request(scope, receive)
+        error_response = await self._security.validate_request(request, is_post=False)
+        if error_response:
+            await error_response(scope, receive, send)
+            raise ValueError("Request validation failed")
+
+        read_stream: MemoryObjectReceiveStream[SessionMessage | Exception]
+        read_stream_writer: MemoryObjectSendStream[SessionMessage | Exception]
+        write_stream: MemoryObjectSendStream[SessionMessage]
+        write_stream_reader: MemoryObjectReceiveStream[SessionMessage]
+
+        read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
+        write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
+
+        session_id = uuid4()
+        user = scope.get("user")
+        if isinstance(user, AuthenticatedUser):
+            self._session_owners[session_id] = authorization_context(user)
+        self._read_stream_writers[session_id] = read_stream_writer
+
+        # URI (path + query) the client will use to POST messages
+        message_path = scope.get("root_path", "").rstrip("/") + self._endpoint
+        client_post_uri = f"{quote(message_path)}?session_id={session_id.hex}"
+
+        # Bounded so a slow client still applies backpressure to the server
+        queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=_QUEUE_SIZE)
+
+        async def sse_writer() -> None:
+            try:
+                async with write_stream_reader:
+                    await queue.put(
+                        _build_sse_frame(b"endpoint", client_post_uri.encode())
+                    )
+                    async for session_message in write_stream_reader:
+                        data = pydantic_core.to_json(
+                            session_message.message, by_alias=True, exclude_none=True
+                        )
+                        await queue.put(_build_sse_frame(b"message", data))
+            finally:
+                # sse-starlette keeps the response open until the generator ends
+                await queue.put(_END_OF_STREAM)
+
+        async def event_generator() -> AsyncGenerator[bytes, None]:
+            while True:
+                message = await _get_message_with_timeout(queue, self._ping_interval)
+                if message is _KEEPALIVE:
+                    yield _KEEPALIVE_FRAME
+                    continue
+                if message is _END_OF_STREAM:
+                    return
+                if queue.empty():
+                    # Let producers that are already runnable queue their frames
+                    # so they share this write instead of taking one each
+                    await asyncio.sleep(0)
+                yield _drain_frames(message, queue)
+
+        async def response_wrapper(scope: Scope, receive: Receive, send: Send) -> None:
+            # The response returning signals a client disconnect
+            await EventSourceResponse(
+                content=event_generator(),
+                data_sender_callable=sse_writer,
+                ping=0,  # Keepalives come from event_generator
+            )(scope, receive, send)
+            await read_stream_writer.aclose()
+            await write_stream_reader.aclose()
+            logger.debug("Client session disconnected %s", session_id)
+
+        try:
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(response_wrapper, scope, receive, send)
+                yield (read_stream, write_stream)
+        finally:
+            self._read_stream_writers.pop(session_id, None)
+            self._session_owners.pop(session_id, None)
@@ -4,9 +4,13 @@ This module provides a factory pattern for creating MCP tools with less boilerpl
 and better type safety.
 """
 
+import inspect
+import operator
+import sys
 from abc import ABC, abstractmethod
 from typing import Any, Callable
 
+import orjson
 from mcp import types
 
 
@@ -79,6 +83,7 @@ class SimpleTool(MCPTool):
         """
         super().__init__(name, description, input_schema)
         self.handler = handler
+        self._is_coro = inspect.iscoroutinefunction(handler)
 
     async def execute(
         self, arguments: dict[str, Any]
@@ -91,46 +96,48 @@ class SimpleTool(MCPTool):
         Returns:
             List of text content with result
         """
-        import inspect
-
-        if inspect.iscoroutinefunction(self.handler):
+        if self._is_coro:
             result = await self.handler(arguments)
         else:
             result = self.handler(arguments)
 
         if isinstance(result, dict):
-            import json
-
-            result_text = json.dumps(result, indent=2)
+            result_text = orjson.dumps(
+                result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode()
         else:
             result_text = str(result)
 
         return [types.TextContent(type="text", text=result_text)]
 
 
-class CalculatorTool(MCPTool):
-    """Calculator tool for arithmetic operations."""
+# Calculator operations: name -> (description, function)
+_OPERATIONS: dict[str, tuple[str, Callable[[float, float], float]]] = {
+    "sum": ("Calculate the sum of two numbers", operator.add),
+    "subtract": ("Subtract second number from first", operator.sub),
+    "multiply": ("Multiply two numbers", operator.mul),
+    "divide": ("Divide first number by second", operator.truediv),
+}
 
-    def __init__(self, operation: str):
-        """Initialize calculator tool.
+_DIVISION_BY_ZERO = "Error: Division by zero"
+
+
+class BaseCalculatorTool(MCPTool):
+    """Base class for calculator tools taking two numbers, 'a' and 'b'.
+
+    Holds the MCP metadata only, with no per-operation dispatch state.
+    """
+
+    def __init__(self, operation: str, description: str):
+        """Initialize calculator tool metadata.
 
         Args:
             operation: Operation type (sum, subtract, multiply, divide)
+            description: Tool description
         """
-        operations = {
-            "sum": ("Calculate the sum of two numbers", "+"),
-            "subtract": ("Subtract second number from first", "-"),
-            "multiply": ("Multiply two numbers", "*"),
-            "divide": ("Divide first number by second", "/"),
-        }
-
-        if operation not in operations:
-            raise ValueError(f"Unknown operation: {operation}")
-
-        desc, _ = operations[operation]
         super().__init__(
             name=f"calculate_{operation}",
-            description=desc,
+            description=description,
             input_schema={
                 "type": "object",
                 "properties": {
@@ -142,6 +149,42 @@ class CalculatorTool(MCPTool):
         )
         self.operation = operation
 
+    @abstractmethod
+    async def execute(
+        self, arguments: dict[str, Any]
+    ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+        """Execute calculation.
+
+        Args:
+            arguments: Tool arguments with 'a' and 'b' numbers
+
+        Returns:
+            List with calculation result
+        """
+
+
+class CalculatorTool(BaseCalculatorTool):
+    """Calculator tool for arithmetic operations.
+
+    Use ``create_calculator_tool`` to get a tool specialized for the
+    operation instead of dispatching on it at call time.
+    """
+
+    def __init__(self, operation: str):
+        """Initialize calculator tool.
+
+        Args:
+            operation: Operation type (sum, subtract, multiply, divide)
+        """
+        try:
+            desc, func = _OPERATIONS[operation]
+        except KeyError:
+            raise ValueError(f"Unknown operation: {operation}") from None
+
+        super().__init__(operation, desc)
+        self._op = func
+        self._is_div = func is operator.truediv
+
     async def execute(
         self, arguments: dict[str, Any]
     ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
@@ -159,19 +202,67 @@ class CalculatorTool(MCPTool):
         if not isinstance(a, (int, float)) or not isinstance(b, (int, float)):
             raise ValueError("Arguments must be numbers")
 
-        operations = {
-            "sum": lambda x, y: x + y,
-            "subtract": lambda x, y: x - y,
-            "multiply": lambda x, y: x * y,
-            "divide": lambda x, y: x / y if y != 0 else None,
-        }
+        if self._is_div and b == 0:
+            return [types.TextContent(type="text", text=_DIVISION_BY_ZERO)]
+
+        return [types.TextContent(type="text", text=str(self._op(a, b)))]
+
+
+def _make_calculator_class(
+    operation: str, description: str, func: Callable[[float, float], float]
+) -> type[BaseCalculatorTool]:
+    """Create a calculator tool class for a single operation.
+
+    The class binds the operation when it is created: it takes no
+    constructor arguments and calls ``func`` directly, keeping each
+    ``execute`` call site monomorphic.
+
+    Args:
+        operation: Operation name
+        description: Tool description
+        func: Binary function implementing the operation
+
+    Returns:
+        Concrete BaseCalculatorTool subclass
+    """
+    check_zero = func is operator.truediv
+
+    class _Calculator(BaseCalculatorTool):
+        def __init__(self) -> None:
+            super().__init__(operation, description)
+
+        async def execute(
+            self, arguments: dict[str, Any]
+        ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+            """Execute calculation.
+
+            Args:
+                arguments: Tool arguments with 'a' and 'b' numbers
+
+            Returns:
+                List with calculation result
+            """
+            a = arguments.get("a")
+            b = arguments.get("b")
+
+            if not isinstance(a, (int, float)) or not isinstance(b, (int, float)):
+                raise ValueError("Arguments must be numbers")
+
+            if check_zero and b == 0:
+                return [types.TextContent(type="text", text=_DIVISION_BY_ZERO)]
 
-        result = operations[self.operation](a, b)
+            return [types.TextContent(type="text", text=str(func(a, b)))]
 
-        if result is None:
-            return [types.TextContent(type="text", text="Error: Division by zero")]
+    _Calculator.__name__ = _Calculator.__qualname__ = (
+        f"{operation.capitalize()}CalculatorTool"
+    )
+    return _Calculator
 
-        return [types.TextContent(type="text", text=str(result))]
+
+_CALCULATOR_CLASSES: dict[str, type[BaseCalculatorTool]] = {
+    operation: _make_calculator_class(operation, description, func)
+    for operation, (description, func) in _OPERATIONS.items()
+}
 
 
 class MCPToolRegistry:
@@ -180,6 +271,8 @@ class MCPToolRegistry:
     def __init__(self):
         """Initialize tool registry."""
         self._tools: dict[str, MCPTool] = {}
+        self._mcp_tools: dict[str, types.Tool] = {}
+        self._tool_list: list[types.Tool] = []
 
     def register(self, tool: MCPTool) -> None:
         """Register a tool.
@@ -187,7 +280,23 @@ class MCPToolRegistry:
         Args:
             tool: Tool to register
         """
-        self._tools[tool.name] = tool
+        name = sys.intern(tool.name)
+        self._tools[name] = tool
+        self._mcp_tools[name] = tool.to_mcp_tool()
+        self._tool_list = list(self._mcp_tools.values())
+
+    def unregister(self, name: str) -> None:
+        """Unregister a tool.
+
+        Args:
+            name: Tool name
+
+        Raises:
+            KeyError: If no tool is registered with this name
+        """
+        del self._tools[name]
+        del self._mcp_tools[name]
+        self._tool_list = list(self._mcp_tools.values())
 
     def get(self, name: str) -> MCPTool | None:
         """Get a tool by name.
@@ -203,10 +312,13 @@ class MCPToolRegistry:
     def list_tools(self) -> list[types.Tool]:
         """List all registered tools as MCP tools.
 
+        The definitions are built once at registration; callers must not
+        mutate the returned list.
+
         Returns:
             List of MCP tool definitions
         """
-        return [tool.to_mcp_tool() for tool in self._tools.values()]
+        return self._tool_list
 
     async def execute_tool(
         self, name: str, arguments: dict[str, Any] | None
@@ -223,9 +335,10 @@ class MCPToolRegistry:
         Raises:
             ValueError: If tool not found or arguments invalid
         """
-        tool = self.get(name)
-        if not tool:
-            raise ValueError(f"Unknown tool: {name}")
+        try:
+            tool = self._tools[name]
+        except KeyError:
+            raise ValueError(f"Unknown tool: {name}") from None
 
         if arguments is None:
             arguments = {}
@@ -263,3 +376,21 @@ def create_simple_tool(
     }
 
     return SimpleTool(name, description, input_schema, handler)
+
+
+def create_calculator_tool(operation: str) -> BaseCalculatorTool:
+    """Factory function to create a calculator tool.
+
+    Args:
+        operation: Operation type (sum, subtract, multiply, divide)
+
+    Returns:
+        Calculator tool specialized for the operation
+
+    Raises:
+        ValueError: If the operation is unknown
+    """
+    calculator_class = _CALCULATOR_CLASSES.get(operation)
+    if calculator_class is None:
+        raise ValueError(f"Unknown operation: {operation}")
+    return calculator_class()
@@ -13,9 +13,11 @@ from sse_mcp_server.presentation.v1 import sse_transport
 
 
 @asynccontextmanager
-async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
+async def lifespan(application: FastAPI) -> AsyncGenerator[None, None]:
     """Lifespan events for application startup and shutdown."""
     # Startup
+    # Build the OpenAPI schema once; FastAPI keeps it on the app for later requests
+    application.openapi()
     yield
     # Shutdown
 
@@ -86,6 +88,10 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
+        # Both ship with uvicorn[standard]; fail fast rather than silently
+        # falling back to the slower asyncio loop and h11 parser
+        loop="uvloop",
+        http="httptools",
     )
 
 
@@ -4,37 +4,90 @@ This module contains the v1 API routes including health check and SSE endpoints.
 """
 
 import logging
+import time
 from typing import Annotated
 
+import orjson
 from fastapi import APIRouter, Depends, Request, Response
-from mcp.server.sse import SseServerTransport
 
 from sse_mcp_server.application.services import SystemHealthService
 from sse_mcp_server.config.settings import settings
 from sse_mcp_server.domain.protocols import HealthService
 from sse_mcp_server.infrastructure.mcp_server import mcp_server
+from sse_mcp_server.infrastructure.sse_transport import SseTransport
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 # Create SSE transport with endpoint for POST messages
-sse_transport = SseServerTransport(f"{settings.api_v1_str}/messages")
+sse_transport = SseTransport(
+    f"{settings.api_v1_str}/messages", ping_interval=settings.sse_ping_interval
+)
+
+# Handlers are registered at import, so the advertised options never change;
+# the SDK only reads them, so one instance is shared by every connection
+_INIT_OPTIONS = mcp_server.create_initialization_options()
+
+# The health service is stateless, so a single instance serves every request
+_HEALTH_SERVICE: HealthService = SystemHealthService()
+
+
+class _HealthResponseCache:
+    """Serialized health response reused for ``ttl`` seconds.
+
+    The service is queried at most once per ``ttl`` seconds, so a change in
+    the reported status shows up within that delay.
+    """
+
+    def __init__(self, ttl: float):
+        self._ttl = ttl
+        self._body: bytes | None = None
+        self._expires_at = 0.0
+
+    async def get(self, service: HealthService) -> bytes:
+        """Return the cached response, refreshing it from ``service`` if stale.
+
+        Args:
+            service: Health service queried when the cached body has expired
+
+        Returns:
+            JSON encoded health response
+        """
+        now = time.monotonic()
+        if self._body is None or now >= self._expires_at:
+            health = await service.check_health()
+            self._body = orjson.dumps(
+                {
+                    "status": str(health.get("status")),
+                    "version": str(health.get("version")),
+                    "environment": str(health.get("environment")),
+                }
+            )
+            self._expires_at = now + self._ttl
+        return self._body
+
+    def clear(self) -> None:
+        """Drop the cached response so the next request queries the service."""
+        self._body = None
+
+
+_HEALTH_RESPONSE = _HealthResponseCache(ttl=1.0)
 
 
 def get_health_service() -> HealthService:
     """Dependency provider for HealthService.
 
     Returns:
-        HealthService: Health service instance
+        HealthService: Shared health service instance
     """
-    return SystemHealthService()
+    return _HEALTH_SERVICE
 
 
-@router.get("/health")
+@router.get("/health", response_model=dict[str, str])
 async def health_check(
     service: Annotated[HealthService, Depends(get_health_service)],
-) -> dict[str, str]:
+) -> Response:
     """Health check endpoint.
 
     Args:
@@ -43,12 +96,10 @@ async def health_check(
     Returns:
         Dictionary with health status and version
     """
-    health = await service.check_health()
-    return {
-        "status": str(health.get("status")),
-        "version": str(health.get("version")),
-        "environment": str(health.get("environment")),
-    }
+    # Pre-encoded JSON bypasses response model validation and serialization
+    return Response(
+        content=await _HEALTH_RESPONSE.get(service), media_type="application/json"
+    )
 
 
 @router.get("/sse")
@@ -68,7 +119,5 @@ async def handle_sse(request: Request) -> Response:
         request.receive,
         request._send,  # pylint: disable=protected-access
     ) as streams:
-        await mcp_server.run(
-            streams[0], streams[1], mcp_server.create_initialization_options()
-        )
+        await mcp_server.run(streams[0], streams[1], _INIT_OPTIONS)
     return Response()
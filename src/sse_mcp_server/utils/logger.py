@@ -3,64 +3,260 @@
 Enhanced logging module that provides functionality to create and configure loggers.
 It supports console logging with rich formatting and optional file logging.
 Log levels and formats are configurable.
+
+Records are handed to a queue and written by a background listener thread, so
+the calling code (e.g. the event loop) never blocks on rendering or file I/O.
 """
 
+import atexit
+import functools
 import logging
 import os
+import queue
+import sys
+import threading
+from collections.abc import Mapping
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any, Dict, Union
 
+import orjson
 from rich.console import Console
 from rich.logging import RichHandler
 from rich.theme import Theme
 
 
-class StructuredLogger:
-    """Wrapper for logging.Logger that accepts structured keyword arguments."""
+def _logfmt_value(value: Any) -> str:
+    """Render a value for a logfmt pair, quoting it when needed."""
+    text = str(value)
+    # Whitespace, control characters, "=" and quotes would break key=value
+    # parsing; JSON string escaping keeps the pair on one line
+    if (
+        not text
+        or not text.isprintable()
+        or "=" in text
+        or '"' in text
+        or any(char.isspace() for char in text)
+    ):
+        return orjson.dumps(text).decode()
+    return text
 
-    def __init__(self, logger: logging.Logger):
-        self._logger = logger
 
-    def _format(self, msg: str, kwargs: dict) -> str:
-        if kwargs:
-            try:
-                props = " " + str(kwargs)
-            except (TypeError, ValueError):
-                props = ""
-            return f"{msg}|{props}"
-        return msg
+class _LazyProps:
+    """Structured keyword arguments rendered only when a handler formats the record.
+
+    Fields are rendered as logfmt ``key=value`` pairs.
+    """
+
+    __slots__ = ("_kwargs",)
+
+    def __init__(self, kwargs: dict):
+        self._kwargs = kwargs
+
+    def __str__(self) -> str:
+        return " " + " ".join(
+            f"{key}={_logfmt_value(value)}" for key, value in self._kwargs.items()
+        )
+
+
+# Field name used to pass structured kwargs alongside a mapping argument
+_PROPS_KEY = "__structured_props__"
+
+
+def _with_props(msg: Any, args: tuple, kwargs: dict) -> tuple[str, tuple]:
+    """Append structured keyword arguments to a message as a deferred argument.
+
+    ``msg`` may be any object, as with ``logging``. A lone mapping argument is
+    kept as a mapping, so ``%(name)s`` placeholders still resolve, and the
+    kwargs go in under ``_PROPS_KEY``.
+    """
+    props = _LazyProps(kwargs)
+    template = str(msg)
+    if not args:
+        # Escape literal "%" since logging would not otherwise format msg
+        return template.replace("%", "%%") + "|%s", (props,)
+    if len(args) == 1 and isinstance(args[0], Mapping) and args[0]:
+        return f"{template}|%({_PROPS_KEY})s", ({**args[0], _PROPS_KEY: props},)
+    return template + "|%s", (*args, props)
 
-    def debug(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        self._logger.debug(self._format(msg, kwargs), *args)
 
-    def info(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        self._logger.info(self._format(msg, kwargs), *args)
+# Keyword arguments consumed by logging itself rather than rendered as fields
+_LOGGING_KWARGS = frozenset({"exc_info", "stack_info", "stacklevel", "extra"})
 
-    def warning(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        self._logger.warning(self._format(msg, kwargs), *args)
 
-    warn = warning
+class StructuredLogger(logging.LoggerAdapter):
+    """Logger adapter that accepts structured keyword arguments.
 
-    def error(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        self._logger.error(self._format(msg, kwargs), *args)
+    Level methods come from ``logging.LoggerAdapter`` and all funnel into
+    ``log``, which returns early when the level is disabled. Keyword arguments
+    other than logging's own are passed as a deferred ``%s`` argument, so they
+    are only serialized by ``LogRecord.getMessage()`` when a handler emits the
+    record.
+    """
 
-    def critical(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        self._logger.critical(self._format(msg, kwargs), *args)
+    def __init__(self, logger: logging.Logger, listener: QueueListener | None = None):
+        super().__init__(logger)
+        self._listener = listener
+        # Bound once so each call skips the attribute lookups on the logger
+        self._is_enabled_for = logger.isEnabledFor
+        self._log = logger.log
+
+    def log(self, level: int, msg: Any, *args: Any, **kwargs: Any) -> None:
+        if not self._is_enabled_for(level):
+            return
+        log_kwargs = {}
+        if kwargs:
+            for key in _LOGGING_KWARGS.intersection(kwargs):
+                log_kwargs[key] = kwargs.pop(key)
+            if kwargs:
+                msg, args = _with_props(msg, args, kwargs)
+        # Skip this frame so records report the caller
+        log_kwargs["stacklevel"] = log_kwargs.get("stacklevel", 1) + 1
+        self._log(level, msg, *args, **log_kwargs)
 
     # Provide access to underlying logger methods if needed
     def get_underlying(self) -> logging.Logger:
-        return self._logger
+        return self.logger
+
+    def get_listener(self) -> QueueListener | None:
+        return self._listener
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Queue handler that leaves formatting to the listener thread.
+
+    The stock ``prepare()`` formats the record on the calling thread and drops
+    ``exc_info``. The listener runs in the same process, so the record can be
+    queued as is and rendered there, tracebacks included. Arguments are thus
+    formatted after the logging call returns: a mutable argument is rendered
+    as it is when the listener reaches the record, not as it was when logged.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _SafeQueueListener(QueueListener):
+    """Queue listener that survives handlers raising while emitting a record.
+
+    Formatting happens on the listener thread, so an exception escaping a
+    handler (e.g. from ``RichHandler`` or a bad ``%`` argument) would otherwise
+    end the thread and silently drop every later record.
+    """
+
+    def handle(self, record: logging.LogRecord) -> None:
+        record = self.prepare(record)
+        for handler in self.handlers:
+            if self.respect_handler_level and record.levelno < handler.level:
+                continue
+            try:
+                handler.handle(record)
+            except Exception:  # Same contract as logging.Handler.emit
+                handler.handleError(record)
+
+
+class BufferedFileHandler(logging.Handler):
+    """File handler that batches writes in a large buffer.
+
+    Records are appended to a buffered binary stream and flushed to disk by a
+    background thread every ``flush_interval`` seconds, when the buffer fills,
+    or on close.
+    """
+
+    def __init__(
+        self,
+        filename: str | Path,
+        buffer_size: int = 64 * 1024,
+        flush_interval: float = 0.2,
+        encoding: str = "utf-8",
+    ):
+        super().__init__()
+        self.filename = os.path.abspath(filename)
+        self.encoding = encoding
+        self._stream = open(self.filename, "ab", buffering=buffer_size)
+        self._flush_interval = flush_interval
+        self._stop_flushing = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name="log-flusher", daemon=True
+        )
+        self._flusher.start()
+
+    def _flush_periodically(self) -> None:
+        while not self._stop_flushing.wait(self._flush_interval):
+            self.flush()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._stream.write((self.format(record) + "\n").encode(self.encoding))
+        except RecursionError:  # See logging.StreamHandler.emit
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        with self.lock:
+            if not self._stream.closed:
+                self._stream.flush()
+
+    def close(self) -> None:
+        self._stop_flushing.set()
+        with self.lock:
+            if not self._stream.closed:
+                self._stream.flush()
+                self._stream.close()
+        super().close()
 
 
 # Dictionary to store created loggers to prevent duplicates
 _LOGGER_CACHE: Dict[str, StructuredLogger] = {}
 
+DEFAULT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Log directories already created by this process
+_ENSURED_DIRS: set[Path] = set()
+
+# Formatters are stateless, so one instance per format string is shared
+_FORMATTER_CACHE: Dict[str, logging.Formatter] = {}
+
+
+def _get_formatter(log_format: str) -> logging.Formatter:
+    formatter = _FORMATTER_CACHE.get(log_format)
+    if formatter is None:
+        formatter = _FORMATTER_CACHE[log_format] = logging.Formatter(log_format)
+    return formatter
+
+
+# Theme shared by every Rich console handler
+_CUSTOM_THEME = Theme(
+    {
+        "info": "green",
+        "warning": "yellow",
+        "error": "bold red",
+        "critical": "bold white on red",
+    }
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_rich_console() -> Console:
+    # Console probes the terminal on creation, so it is built once, on first use
+    return Console(theme=_CUSTOM_THEME)
+
+
+def _make_rich_handler() -> RichHandler:
+    return RichHandler(
+        console=_get_rich_console(),
+        rich_tracebacks=True,
+        markup=True,
+        show_time=False,  # Time will be in the formatter
+    )
+
 
 def get_console_logger(
     name: str | None = "default",
     level: Union[int, str] = logging.DEBUG,
     log_file: str | Path | None = None,
-    log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    log_format: str = DEFAULT_LOG_FORMAT,
     use_rich: bool = True,
 ) -> StructuredLogger:
     """
@@ -73,7 +269,8 @@ def get_console_logger(
             will be written to this file.
         log_format (str, optional): Format string for log messages.
         use_rich (bool, optional): Whether to use rich formatting for console output.
-            Defaults to True.
+            Only honoured when stdout is a terminal; piped output (e.g. to a log
+            shipper) always uses a plain stream handler. Defaults to True.
 
     Returns:
         logging.Logger: The configured logger.
@@ -84,11 +281,13 @@ def get_console_logger(
         name = "default"
 
     # Check if logger with this name already exists in cache
-    if name in _LOGGER_CACHE:
-        return _LOGGER_CACHE[name]
+    cached = _LOGGER_CACHE.get(name)
+    if cached is not None:
+        return cached
 
     # Get or create logger
     base_logger = logging.getLogger(name)
+    listener = None
 
     # Only configure if no handlers exist
     if not base_logger.handlers:
@@ -99,50 +298,65 @@ def get_console_logger(
         base_logger.setLevel(level)
         base_logger.propagate = False  # Prevent duplicate logs
 
-        # Console handler with optional Rich formatting
-        if use_rich:
-            # Create a custom theme for rich console
-            custom_theme = Theme(
-                {
-                    "info": "green",
-                    "warning": "yellow",
-                    "error": "bold red",
-                    "critical": "bold white on red",
-                }
-            )
-            console = Console(theme=custom_theme)
-            console_handler = RichHandler(
-                console=console,
-                rich_tracebacks=True,
-                markup=True,
-                show_time=False,  # Time will be in the formatter
-            )
+        # Console handler with optional Rich formatting, only worth it on a terminal
+        if use_rich and sys.stdout.isatty():
+            console_handler: logging.Handler = _make_rich_handler()
         else:
             console_handler = logging.StreamHandler()
 
         console_handler.setLevel(level)
-        console_formatter = logging.Formatter(log_format)
-        console_handler.setFormatter(console_formatter)
-        base_logger.addHandler(console_handler)
+        console_handler.setFormatter(_get_formatter(log_format))
+        handlers: list[logging.Handler] = [console_handler]
 
         # File handler (if log_file is provided)
         if log_file:
             log_path = Path(log_file)
 
-            # Create directory if it doesn't exist
-            os.makedirs(log_path.parent, exist_ok=True)
+            # Create directory if it doesn't exist, touching each one only once
+            parent = log_path.parent
+            if parent not in _ENSURED_DIRS:
+                parent.mkdir(parents=True, exist_ok=True)
+                _ENSURED_DIRS.add(parent)
 
-            file_handler = logging.FileHandler(log_path)
+            file_handler = BufferedFileHandler(log_path)
             file_handler.setLevel(level)
-            file_formatter = logging.Formatter(log_format)
-            file_handler.setFormatter(file_formatter)
-            base_logger.addHandler(file_handler)
-
-    wrapped = StructuredLogger(base_logger)
+            file_handler.setFormatter(_get_formatter(log_format))
+            handlers.append(file_handler)
+
+        # Producers only enqueue; the listener thread drives the real handlers
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        base_logger.addHandler(_DeferredQueueHandler(log_queue))
+        listener = _SafeQueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        listener.start()
+        # Drain pending records on interpreter exit
+        atexit.register(listener.stop)
+
+    wrapped = StructuredLogger(base_logger, listener)
     _LOGGER_CACHE[name] = wrapped
     return wrapped
 
 
 def clear_logger_cache():
-    """Clears the logger cache, useful for testing or reconfiguration."""
+    """Clears the logger cache, useful for testing or reconfiguration.
+
+    Background listeners are stopped after flushing their queue and their
+    exit hooks are unregistered. Every handler of a cached logger, including
+    those driven by its listener, is closed and detached so file descriptors
+    are released.
+    """
+    for wrapped in _LOGGER_CACHE.values():
+        handlers: list[logging.Handler] = []
+        listener = wrapped.get_listener()
+        if listener is not None:
+            listener.stop()
+            atexit.unregister(listener.stop)
+            handlers.extend(listener.handlers)
+        base_logger = wrapped.get_underlying()
+        for handler in list(base_logger.handlers):
+            base_logger.removeHandler(handler)
+            handlers.append(handler)
+        for handler in handlers:
+            handler.close()
     _LOGGER_CACHE.clear()
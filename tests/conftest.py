@@ -1,26 +1,22 @@
 # pylint: disable=import-error
 
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator
 
-import pytest
 import pytest_asyncio
-from fastapi.testclient import TestClient
 from httpx import ASGITransport, AsyncClient
 
 from sse_mcp_server.main import app
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session")
 async def async_client() -> AsyncGenerator[AsyncClient, None]:
-    """Fixture for async HTTP client."""
+    """Fixture for async HTTP client, shared by the whole test session.
+
+    pytest.ini runs every async test and fixture on the session event loop,
+    which the client is bound to.
+    """
     async with AsyncClient(
         transport=ASGITransport(app=app), base_url="http://test"
     ) as client:
         yield client
 
-
-@pytest.fixture
-def client() -> Generator[TestClient, None, None]:
-    """Fixture for synchronous TestClient."""
-    with TestClient(app) as c:
-        yield c
@@ -1,9 +1,16 @@
-import pytest
+from typing import Any
+
 from httpx import AsyncClient
 from starlette import status
 
+from sse_mcp_server.main import app
+from sse_mcp_server.presentation.v1.api import (
+    _HEALTH_RESPONSE,
+    _HealthResponseCache,
+    get_health_service,
+)
+
 
-@pytest.mark.asyncio
 async def test_health_check(async_client: AsyncClient) -> None:
     """Test the health check endpoint."""
     response = await async_client.get("/mcp/v1/health")
@@ -17,6 +24,43 @@ async def test_health_check(async_client: AsyncClient) -> None:
     assert data["environment"] in ["development", "staging", "production", "test"]
 
 
+class _CountingHealthService:
+    """Health service stub counting how often it is checked."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def check_health(self) -> dict[str, Any]:
+        self.calls += 1
+        return {"status": "online", "version": "9.9.9", "environment": "test"}
+
+
+async def test_health_check_response_is_cached(async_client: AsyncClient) -> None:
+    """Test that repeated health checks reuse the cached response."""
+    service = _CountingHealthService()
+    app.dependency_overrides[get_health_service] = lambda: service
+    _HEALTH_RESPONSE.clear()
+    try:
+        first = await async_client.get("/mcp/v1/health")
+        second = await async_client.get("/mcp/v1/health")
+    finally:
+        app.dependency_overrides.clear()
+        _HEALTH_RESPONSE.clear()
+
+    assert first.json() == second.json()
+    assert first.json()["version"] == "9.9.9"
+    assert service.calls == 1
+
+
+async def test_health_response_cache_expires() -> None:
+    """Test that the cached response is rebuilt once its TTL has elapsed."""
+    service = _CountingHealthService()
+    cache = _HealthResponseCache(ttl=0.0)
+
+    assert await cache.get(service) == await cache.get(service)
+    assert service.calls == 2
+
+
 def test_sse_endpoint_exists() -> None:
     """
     Test placeholder for SSE endpoint.
@@ -25,3 +69,12 @@ def test_sse_endpoint_exists() -> None:
     """
     # SSE endpoint is tested via integration/e2e tests
     assert True  # Placeholder test
+
+
+async def test_lifespan_builds_openapi_schema() -> None:
+    """Test that application startup builds the OpenAPI schema up front."""
+    app.openapi_schema = None
+    async with app.router.lifespan_context(app):
+        schema = app.openapi_schema
+        assert schema is not None
+        assert app.openapi() is schema
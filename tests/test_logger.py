@@ -0,0 +1,342 @@
+"""Tests for the structured console logger."""
+
+# pylint: disable=import-error,protected-access
+
+import atexit
+import io
+import logging
+import sys
+import threading
+import time
+from collections.abc import Callable, Generator
+from logging.handlers import QueueHandler
+from pathlib import Path
+
+import pytest
+from rich.logging import RichHandler
+
+from sse_mcp_server.utils import logger as logger_module
+from sse_mcp_server.utils.logger import (
+    BufferedFileHandler,
+    StructuredLogger,
+    clear_logger_cache,
+    get_console_logger,
+)
+
+
+class _ListHandler(logging.Handler):
+    """Handler collecting emitted records for assertions."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+LoggerFactory = Callable[[int], tuple[StructuredLogger, _ListHandler]]
+
+
+@pytest.fixture
+def make_logger(
+    request: pytest.FixtureRequest,
+) -> Generator[LoggerFactory, None, None]:
+    """Create a logger named after the test with a collecting handler."""
+    clear_logger_cache()
+
+    def factory(level: int) -> tuple[StructuredLogger, _ListHandler]:
+        logger = get_console_logger(request.node.name, level=level, use_rich=False)
+        handler = _ListHandler()
+        logger.get_underlying().addHandler(handler)
+        return logger, handler
+
+    yield factory
+    clear_logger_cache()
+
+
+def test_logger_is_cached(make_logger: LoggerFactory) -> None:
+    """Test that the same wrapper is returned for the same name."""
+    logger, _ = make_logger(logging.INFO)
+    assert get_console_logger(logger.get_underlying().name) is logger
+
+
+def test_structured_kwargs_are_rendered(make_logger: LoggerFactory) -> None:
+    """Test that keyword arguments are appended to the message."""
+    logger, handler = make_logger(logging.INFO)
+    logger.info("user %s logged in", "alice", user_id=42)
+
+    assert len(handler.records) == 1
+    message = handler.records[0].getMessage()
+    assert message == "user alice logged in| user_id=42"
+
+
+def test_disabled_level_is_skipped(make_logger: LoggerFactory) -> None:
+    """Test that records below the configured level are not emitted."""
+    logger, handler = make_logger(logging.WARNING)
+    logger.debug("hidden", detail="x")
+    logger.info("hidden")
+    logger.warning("shown")
+
+    assert [r.getMessage() for r in handler.records] == ["shown"]
+
+
+def test_record_reports_caller_location(make_logger: LoggerFactory) -> None:
+    """Test that records point at the calling code, not the wrapper."""
+    logger, handler = make_logger(logging.INFO)
+    logger.info("from the test")
+    logger.info("with props", key="value")
+
+    assert {r.filename for r in handler.records} == {"test_logger.py"}
+
+
+def test_kwargs_are_serialized_lazily(make_logger: LoggerFactory) -> None:
+    """Test that kwargs are only rendered when the message is formatted."""
+    logger, handler = make_logger(logging.INFO)
+    logger.info("100% done", step="final")
+
+    record = handler.records[0]
+    assert record.msg.endswith("|%s")
+    assert record.getMessage() == '100% done| step=final'
+
+
+
+def test_non_string_message_with_kwargs(make_logger: LoggerFactory) -> None:
+    """Test that any object can be logged with structured kwargs."""
+    logger, handler = make_logger(logging.INFO)
+    logger.info(ValueError("boom 100%"), attempt=2)
+
+    assert handler.records[0].getMessage() == "boom 100%| attempt=2"
+
+
+def test_mapping_argument_with_kwargs(make_logger: LoggerFactory) -> None:
+    """Test that a lone mapping argument still fills named placeholders."""
+    logger, handler = make_logger(logging.INFO)
+    logger.info("user %(name)s", {"name": "alice"}, attempt=2)
+
+    assert handler.records[0].getMessage() == "user alice| attempt=2"
+
+def test_records_are_written_by_background_listener(
+    request: pytest.FixtureRequest, tmp_path: Path
+) -> None:
+    """Test that records go through the queue to the file handler."""
+    log_file = tmp_path / "app.log"
+    logger = get_console_logger(
+        request.node.name, level=logging.INFO, log_file=log_file, use_rich=False
+    )
+    base_logger = logger.get_underlying()
+    (queue_handler,) = base_logger.handlers
+    assert isinstance(queue_handler, QueueHandler)
+
+    listener = logger.get_listener()
+    assert listener is not None
+    (file_handler,) = [
+        h for h in listener.handlers if isinstance(h, BufferedFileHandler)
+    ]
+
+    logger.info("queued message", request_id=7)
+
+    # Clearing drains the queue, then closes and detaches every handler
+    clear_logger_cache()
+    assert "queued message" in log_file.read_text(encoding="utf-8")
+    assert not base_logger.handlers
+    assert file_handler._stream.closed
+
+
+def test_buffered_file_handler_flushes_periodically(tmp_path: Path) -> None:
+    """Test that buffered records reach the file without an explicit flush."""
+    log_file = tmp_path / "buffered.log"
+    handler = BufferedFileHandler(log_file, flush_interval=0.01)
+    try:
+        handler.emit(logging.makeLogRecord({"msg": "first"}))
+        handler.emit(logging.makeLogRecord({"msg": "second"}))
+
+        deadline = time.monotonic() + 2
+        while "second" not in log_file.read_text(encoding="utf-8"):
+            assert time.monotonic() < deadline, "buffer was never flushed"
+            time.sleep(0.01)
+    finally:
+        handler.close()
+
+    assert log_file.read_text(encoding="utf-8") == "first\nsecond\n"
+
+
+
+class _Unprintable:
+    """Log argument whose rendering fails."""
+
+    def __str__(self) -> str:
+        raise RuntimeError("cannot render")
+
+
+def test_buffered_file_handler_reports_format_errors(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test that a record failing to format is reported, not raised."""
+    log_file = tmp_path / "buffered.log"
+    handler = BufferedFileHandler(log_file)
+    try:
+        handler.emit(logging.makeLogRecord({"msg": "%s", "args": (_Unprintable(),)}))
+        handler.emit(logging.makeLogRecord({"msg": "after"}))
+    finally:
+        handler.close()
+
+    assert log_file.read_text(encoding="utf-8") == "after\n"
+    assert "Logging error" in capsys.readouterr().err
+
+def test_logging_kwargs_are_not_rendered(make_logger: LoggerFactory) -> None:
+    """Test that logging's own keyword arguments keep their meaning."""
+    logger, handler = make_logger(logging.INFO)
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        logger.exception("failed", attempt=2)
+
+    record = handler.records[0]
+    assert record.exc_info is not None
+    assert record.getMessage() == 'failed| attempt=2'
+    assert record.filename == "test_logger.py"
+
+
+def test_log_directory_is_created(
+    request: pytest.FixtureRequest, tmp_path: Path
+) -> None:
+    """Test that a missing log directory is created once and remembered."""
+    log_file = tmp_path / "nested" / "logs" / "app.log"
+    try:
+        get_console_logger(
+            request.node.name, level=logging.INFO, log_file=log_file, use_rich=False
+        )
+        assert log_file.parent.is_dir()
+        assert log_file.parent in logger_module._ENSURED_DIRS
+    finally:
+        clear_logger_cache()
+
+
+def test_rich_is_skipped_when_stdout_is_not_a_tty(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that piped output falls back to a plain stream handler."""
+    monkeypatch.setattr(sys, "stdout", io.StringIO())
+    try:
+        logger = get_console_logger(request.node.name, level=logging.INFO)
+        listener = logger.get_listener()
+        assert listener is not None
+        assert [type(h) for h in listener.handlers] == [logging.StreamHandler]
+    finally:
+        clear_logger_cache()
+
+
+def test_rich_handlers_share_one_console(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that Rich handlers reuse a single lazily created console."""
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+    try:
+        consoles = []
+        for name in ("rich-first", "rich-second"):
+            listener = get_console_logger(name, level=logging.INFO).get_listener()
+            assert listener is not None
+            (handler,) = listener.handlers
+            assert isinstance(handler, RichHandler)
+            consoles.append(handler.console)
+        assert consoles[0] is consoles[1]
+    finally:
+        clear_logger_cache()
+
+
+def test_kwargs_are_rendered_as_logfmt(make_logger: LoggerFactory) -> None:
+    """Test that fields are key=value pairs, quoting values that need it."""
+    logger, handler = make_logger(logging.INFO)
+    logger.info("request", path="/health", query="a=b", note="two words", empty="")
+
+    assert handler.records[0].getMessage() == (
+        'request| path=/health query="a=b" note="two words" empty=""'
+    )
+
+
+def test_logfmt_quotes_control_characters(make_logger: LoggerFactory) -> None:
+    """Test that newlines and tabs are escaped so a record stays on one line."""
+    logger, handler = make_logger(logging.INFO)
+    logger.info("request", note="line1\nline2", tab="a\tb", bell="\x07")
+
+    assert handler.records[0].getMessage() == (
+        'request| note="line1\\nline2" tab="a\\tb" bell="\\u0007"'
+    )
+
+
+class _ThreadProbe:
+    """Log argument recording which threads render it."""
+
+    def __init__(self) -> None:
+        self.threads: list[str] = []
+
+    def __str__(self) -> str:
+        self.threads.append(threading.current_thread().name)
+        return "probe"
+
+
+def test_records_are_formatted_on_listener_thread(
+    request: pytest.FixtureRequest, tmp_path: Path
+) -> None:
+    """Test that records are queued unformatted, keeping their traceback."""
+    log_file = tmp_path / "app.log"
+    logger = get_console_logger(
+        request.node.name, level=logging.INFO, log_file=log_file, use_rich=False
+    )
+    (queue_handler,) = logger.get_underlying().handlers
+    probe = _ThreadProbe()
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        exc_info = sys.exc_info()
+    record = logging.makeLogRecord(
+        {"msg": "value %s", "args": (probe,), "exc_info": exc_info}
+    )
+
+    assert queue_handler.prepare(record) is record
+    assert record.exc_info is exc_info
+    assert not probe.threads
+
+    logger.info("value %s", probe)
+    clear_logger_cache()
+    assert probe.threads
+    assert threading.main_thread().name not in probe.threads
+
+
+def test_clearing_unregisters_listener_exit_hook(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a cleared logger's listener is not kept alive by atexit."""
+    registered: list[Callable[[], None]] = []
+    monkeypatch.setattr(atexit, "register", registered.append)
+    monkeypatch.setattr(atexit, "unregister", registered.remove)
+
+    listener = get_console_logger(
+        request.node.name, level=logging.INFO, use_rich=False
+    ).get_listener()
+    assert listener is not None
+    assert registered == [listener.stop]
+
+    clear_logger_cache()
+    assert not registered
+
+
+def test_listener_survives_handler_errors(
+    request: pytest.FixtureRequest,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test that a record failing to format does not stop later records."""
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+    log_file = tmp_path / "app.log"
+    logger = get_console_logger(
+        request.node.name, level=logging.INFO, log_file=log_file
+    )
+
+    # RichHandler raises while formatting this record on the listener thread
+    logger.info("bad %d", "x")
+    logger.info("still logging")
+
+    clear_logger_cache()
+    assert "still logging" in log_file.read_text(encoding="utf-8")
+    assert "Logging error" in capsys.readouterr().err
@@ -2,7 +2,17 @@
 
 # pylint: disable=import-error
 
-from sse_mcp_server.config.settings import Environment, settings
+import os
+
+import pytest
+
+from sse_mcp_server.config.settings import (
+    Environment,
+    get_environment,
+    load_env_file,
+    parse_list_from_env,
+    settings,
+)
 
 
 def test_settings_loaded() -> None:
@@ -17,6 +27,26 @@ def test_settings_environment() -> None:
     assert isinstance(settings.environment, Environment)
 
 
+@pytest.mark.parametrize(
+    ("app_env", "expected"),
+    [
+        ("production", Environment.PRODUCTION),
+        ("PROD", Environment.PRODUCTION),
+        ("staging", Environment.STAGING),
+        ("stage", Environment.STAGING),
+        ("test", Environment.TEST),
+        ("development", Environment.DEVELOPMENT),
+        ("unknown", Environment.DEVELOPMENT),
+    ],
+)
+def test_get_environment(
+    monkeypatch: pytest.MonkeyPatch, app_env: str, expected: Environment
+) -> None:
+    """Test APP_ENV resolution."""
+    monkeypatch.setenv("APP_ENV", app_env)
+    assert get_environment() is expected
+
+
 def test_settings_cors_config() -> None:
     """Test CORS configuration."""
     cors_config = settings.get_cors_config()
@@ -51,3 +81,51 @@ def test_environment_helpers() -> None:
         assert not is_prod
     if is_prod:
         assert not is_dev
+
+
+def test_settings_flattened_values() -> None:
+    """Test that flattened settings mirror the nested configuration objects."""
+    assert settings.allowed_origins == settings.cors.allowed_origins
+    assert settings.log_dir == settings.logging.log_dir
+    assert settings.log_level == settings.logging.log_level
+    assert settings.log_format == settings.logging.log_format
+    assert settings.rate_limit_default == settings.rate_limit.default
+    assert settings.rate_limit_endpoints == settings.rate_limit.endpoints
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("*", ["*"]),
+        ("a, b,c", ["a", "b", "c"]),
+        ('"a,b"', ["a", "b"]),
+        ("a,,b,", ["a", "b"]),
+        (" a ", ["a"]),
+    ],
+)
+def test_parse_list_from_env(
+    monkeypatch: pytest.MonkeyPatch, raw: str, expected: list[str]
+) -> None:
+    """Test parsing comma-separated lists from the environment."""
+    monkeypatch.setenv("TEST_LIST", raw)
+    assert parse_list_from_env("TEST_LIST") == expected
+
+
+def test_parse_list_from_env_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the default is returned when the variable is unset."""
+    monkeypatch.delenv("TEST_LIST", raising=False)
+    assert parse_list_from_env("TEST_LIST", ["x"]) == ["x"]
+    assert not parse_list_from_env("TEST_LIST")
+
+
+@pytest.mark.parametrize("error", [PermissionError, NotADirectoryError])
+def test_load_env_file_ignores_unreadable_root(
+    monkeypatch: pytest.MonkeyPatch, error: type[OSError]
+) -> None:
+    """Test that an unreadable project root is treated as having no .env file."""
+
+    def scandir(_path: object) -> None:
+        raise error
+
+    monkeypatch.setattr(os, "scandir", scandir)
+    assert load_env_file() is None
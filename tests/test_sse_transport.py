@@ -0,0 +1,166 @@
+"""Tests for the SSE transport helpers."""
+
+# pylint: disable=import-error,protected-access
+
+import asyncio
+from typing import Any
+
+import pytest
+from mcp.shared.message import SessionMessage
+from mcp.types import JSONRPCMessage, JSONRPCNotification
+
+from sse_mcp_server.infrastructure import sse_transport
+from sse_mcp_server.infrastructure.sse_transport import SseTransport
+
+
+async def test_get_message_returns_queued_message() -> None:
+    """Test that a queued message is returned before the timeout."""
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    queue.put_nowait("hello")
+
+    message = await sse_transport._get_message_with_timeout(queue, 1.0)
+    assert message == "hello"
+
+
+async def test_get_message_waits_for_message_on_idle_queue() -> None:
+    """Test that a message arriving while waiting is returned."""
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    asyncio.get_running_loop().call_later(0.01, queue.put_nowait, "hello")
+
+    message = await sse_transport._get_message_with_timeout(queue, 1.0)
+    assert message == "hello"
+
+
+async def test_get_message_returns_keepalive_on_timeout() -> None:
+    """Test that an idle queue yields the keepalive sentinel without raising."""
+    queue: asyncio.Queue[str] = asyncio.Queue()
+
+    message = await sse_transport._get_message_with_timeout(queue, 0.01)
+    assert message is sse_transport._KEEPALIVE
+
+    # A message arriving after the timeout is not lost
+    queue.put_nowait("late")
+    assert await sse_transport._get_message_with_timeout(queue, 1.0) == "late"
+
+
+
+@pytest.mark.parametrize("timeout", [0, -1])
+async def test_get_message_without_keepalive_waits_for_message(timeout: float) -> None:
+    """Test that a non-positive timeout disables keepalives instead of spinning."""
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    asyncio.get_running_loop().call_later(0.02, queue.put_nowait, "hello")
+
+    message = await sse_transport._get_message_with_timeout(queue, timeout)
+    assert message == "hello"
+
+
+def test_build_sse_frame() -> None:
+    """Test SSE frame encoding."""
+    frame = sse_transport._build_sse_frame(b"message", b'{"id":1}')
+    assert frame == b'event: message\ndata: {"id":1}\n\n'
+
+
+def test_drain_frames_coalesces_queued_frames() -> None:
+    """Test that queued frames are joined into one chunk."""
+    queue: asyncio.Queue[bytes] = asyncio.Queue()
+    queue.put_nowait(b"b")
+    queue.put_nowait(b"c")
+
+    assert sse_transport._drain_frames(b"a", queue) == b"abc"
+    assert queue.empty()
+
+
+def test_drain_frames_respects_size_limit() -> None:
+    """Test that coalescing stops once the batch size limit is reached."""
+    queue: asyncio.Queue[bytes] = asyncio.Queue()
+    big = b"x" * sse_transport._MAX_BATCH_BYTES
+    queue.put_nowait(big)
+    queue.put_nowait(b"next")
+
+    assert sse_transport._drain_frames(b"a", queue) == b"a" + big
+    assert queue.get_nowait() == b"next"
+
+
+def test_drain_frames_stops_at_end_of_stream() -> None:
+    """Test that the end marker is left queued instead of being joined."""
+    queue: asyncio.Queue[Any] = asyncio.Queue()
+    queue.put_nowait(b"b")
+    queue.put_nowait(sse_transport._END_OF_STREAM)
+
+    assert sse_transport._drain_frames(b"a", queue) == b"ab"
+    assert queue.get_nowait() is sse_transport._END_OF_STREAM
+
+
+def _sse_scope() -> dict[str, Any]:
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": "/sse",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"test")],
+    }
+
+
+async def test_connect_sse_streams_messages_and_ends_with_session() -> None:
+    """Test that messages are framed and the response ends when the server closes."""
+    transport = SseTransport("/messages", ping_interval=60)
+    sent: list[dict[str, Any]] = []
+    disconnected = asyncio.Event()
+
+    async def receive() -> dict[str, Any]:
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        sent.append(message)
+
+    notification = JSONRPCMessage(
+        JSONRPCNotification(jsonrpc="2.0", method="notifications/test")
+    )
+    try:
+        async with asyncio.timeout(2):
+            async with transport.connect_sse(_sse_scope(), receive, send) as streams:
+                read_stream, write_stream = streams
+                async with read_stream, write_stream:
+                    await write_stream.send(SessionMessage(notification))
+                    # Closing the write stream ends the session server-side
+                    await write_stream.aclose()
+    finally:
+        disconnected.set()
+
+    assert sent[0]["type"] == "http.response.start"
+    assert sent[-1] == {"type": "http.response.body", "body": b"", "more_body": False}
+    body = b"".join(m.get("body", b"") for m in sent[1:])
+    assert body.startswith(b"event: endpoint\ndata: /messages?session_id=")
+    assert (
+        b'event: message\ndata: {"method":"notifications/test","jsonrpc":"2.0"}\n\n'
+        in body
+    )
+    assert b": ping" not in body
+    assert not transport._read_stream_writers
+
+
+async def test_connect_sse_sends_keepalive_when_idle() -> None:
+    """Test that an idle stream gets keepalive comments until the client leaves."""
+    transport = SseTransport("/messages", ping_interval=0.01)
+    sent: list[dict[str, Any]] = []
+    disconnected = asyncio.Event()
+
+    async def receive() -> dict[str, Any]:
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        sent.append(message)
+        if message.get("body") == sse_transport._KEEPALIVE_FRAME:
+            disconnected.set()
+
+    async with asyncio.timeout(2):
+        async with transport.connect_sse(_sse_scope(), receive, send) as streams:
+            read_stream, write_stream = streams
+            async with read_stream, write_stream:
+                await disconnected.wait()
+
+    keepalive = {"type": "http.response.body", "body": b": ping\n\n", "more_body": True}
+    assert keepalive in sent
@@ -6,13 +6,14 @@ import pytest
 from mcp import types
 
 from sse_mcp_server.infrastructure.tool_factory import (
+    BaseCalculatorTool,
     CalculatorTool,
     MCPToolRegistry,
+    create_calculator_tool,
     create_simple_tool,
 )
 
 
-@pytest.mark.asyncio
 async def test_calculator_tool_sum() -> None:
     """Test calculator sum tool."""
     tool = CalculatorTool("sum")
@@ -24,7 +25,6 @@ async def test_calculator_tool_sum() -> None:
     assert result[0].text == "8"
 
 
-@pytest.mark.asyncio
 async def test_calculator_tool_multiply() -> None:
     """Test calculator multiply tool."""
     tool = CalculatorTool("multiply")
@@ -36,7 +36,6 @@ async def test_calculator_tool_multiply() -> None:
     assert result[0].text == "20"
 
 
-@pytest.mark.asyncio
 async def test_calculator_tool_divide() -> None:
     """Test calculator divide tool."""
     tool = CalculatorTool("divide")
@@ -47,7 +46,6 @@ async def test_calculator_tool_divide() -> None:
     assert result[0].text == "5.0"
 
 
-@pytest.mark.asyncio
 async def test_calculator_tool_divide_by_zero() -> None:
     """Test calculator divide by zero."""
     tool = CalculatorTool("divide")
@@ -58,7 +56,49 @@ async def test_calculator_tool_divide_by_zero() -> None:
     assert "Error" in result[0].text
 
 
-@pytest.mark.asyncio
+async def test_calculator_tool_subtract() -> None:
+    """Test calculator subtract tool."""
+    tool = CalculatorTool("subtract")
+
+    result = await tool.execute({"a": 10, "b": 4})
+    assert isinstance(result[0], types.TextContent)
+    assert result[0].text == "6"
+
+
+@pytest.mark.parametrize(
+    ("operation", "expected"),
+    [("sum", "9"), ("subtract", "3"), ("multiply", "18"), ("divide", "2.0")],
+)
+async def test_create_calculator_tool(operation: str, expected: str) -> None:
+    """Test that the factory returns a calculator specialized for the operation."""
+    tool = create_calculator_tool(operation)
+
+    assert isinstance(tool, BaseCalculatorTool)
+    assert not isinstance(tool, CalculatorTool)
+    assert tool.name == f"calculate_{operation}"
+    assert tool.operation == operation
+    assert tool.to_mcp_tool() == CalculatorTool(operation).to_mcp_tool()
+
+    result = await tool.execute({"a": 6, "b": 3})
+    assert isinstance(result[0], types.TextContent)
+    assert result[0].text == expected
+
+
+async def test_create_calculator_tool_divide_by_zero() -> None:
+    """Test that the specialized divide tool handles division by zero."""
+    result = await create_calculator_tool("divide").execute({"a": 1, "b": 0})
+    assert isinstance(result[0], types.TextContent)
+    assert "Error" in result[0].text
+
+
+def test_calculator_tool_unknown_operation() -> None:
+    """Test that an unknown operation is rejected."""
+    with pytest.raises(ValueError, match="Unknown operation"):
+        CalculatorTool("modulo")
+    with pytest.raises(ValueError, match="Unknown operation"):
+        create_calculator_tool("modulo")
+
+
 async def test_simple_tool_creation() -> None:
     """Test creating a simple tool."""
 
@@ -80,7 +120,26 @@ async def test_simple_tool_creation() -> None:
     assert "Alice" in result[0].text
 
 
-@pytest.mark.asyncio
+async def test_simple_tool_async_handler() -> None:
+    """Test a simple tool with an async handler returning a dict."""
+
+    async def handler(args: dict) -> dict:  # type: ignore[type-arg]
+        return {"echo": args.get("value")}
+
+    tool = create_simple_tool(
+        name="echo",
+        description="Echo a value",
+        properties={"value": {"type": "string"}},
+        required=["value"],
+        handler=handler,
+    )
+
+    result = await tool.execute({"value": "ping"})
+    assert len(result) == 1
+    assert isinstance(result[0], types.TextContent)
+    assert '"echo": "ping"' in result[0].text
+
+
 async def test_tool_registry() -> None:
     """Test tool registry."""
     registry = MCPToolRegistry()
@@ -107,7 +166,21 @@ async def test_tool_registry() -> None:
     assert result[0].text == "10"
 
 
-@pytest.mark.asyncio
+def test_tool_registry_unregister() -> None:
+    """Test that unregistering a tool removes it from the listing."""
+    registry = MCPToolRegistry()
+    registry.register(CalculatorTool("sum"))
+    registry.register(CalculatorTool("divide"))
+
+    registry.unregister("calculate_sum")
+
+    assert registry.get("calculate_sum") is None
+    assert [t.name for t in registry.list_tools()] == ["calculate_divide"]
+
+    with pytest.raises(KeyError):
+        registry.unregister("calculate_sum")
+
+
 async def test_tool_registry_unknown_tool() -> None:
     """Test executing unknown tool raises error."""
     registry = MCPToolRegistry()